@@ -11,6 +11,27 @@ from .const import (
     CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, MIN_SCAN_INTERVAL, MAX_SCAN_INTERVAL
 )
 
+# Extrait l'ID du trajet d'une URL de partage (format: /fr/a/XXXXX)
+_SHARE_ID_RE = re.compile(r"/a/([^/]+)")
+
+_SCAN_INTERVAL_VALIDATOR = vol.All(
+    vol.Coerce(int),
+    vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)
+)
+
+_USER_SCHEMA = vol.Schema({
+    vol.Required(CONF_SHARE_URL): str,
+    vol.Required(CONF_LANGUAGE, default="fr"): vol.In(LANGUAGES),
+    vol.Required(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): _SCAN_INTERVAL_VALIDATOR,
+})
+
+def _options_schema(language: str, scan_interval: int) -> vol.Schema:
+    """Return the options schema for the given defaults."""
+    return vol.Schema({
+        vol.Required(CONF_LANGUAGE, default=language): vol.In(LANGUAGES),
+        vol.Required(CONF_SCAN_INTERVAL, default=scan_interval): _SCAN_INTERVAL_VALIDATOR,
+    })
+
 class LibertyRiderConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Liberty Rider."""
 
@@ -30,7 +51,7 @@ class LibertyRiderConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "invalid_url"
             else:
                 # Extraire l'ID du trajet de l'URL
-                match = re.search(r'/a/([^/]+)', share_url)
+                match = _SHARE_ID_RE.search(share_url)
                 if not match:
                     errors["base"] = "invalid_url_format"
                 else:
@@ -45,14 +66,7 @@ class LibertyRiderConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({
-                vol.Required(CONF_SHARE_URL): str,
-                vol.Required(CONF_LANGUAGE, default="fr"): vol.In(LANGUAGES),
-                vol.Required(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.All(
-                    vol.Coerce(int),
-                    vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)
-                ),
-            }),
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -64,18 +78,10 @@ class LibertyRiderConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 data=user_input,
             )
 
-        options = {
-            vol.Required(CONF_LANGUAGE, default=self.config_entry.data.get(CONF_LANGUAGE, "fr")): vol.In(LANGUAGES),
-            vol.Required(
-                CONF_SCAN_INTERVAL,
-                default=self.config_entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-            ): vol.All(
-                vol.Coerce(int),
-                vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)
-            ),
-        }
-
         return self.async_show_form(
             step_id="options",
-            data_schema=vol.Schema(options),
+            data_schema=_options_schema(
+                self.config_entry.data.get(CONF_LANGUAGE, "fr"),
+                self.config_entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            ),
         ) 
\ No newline at end of file
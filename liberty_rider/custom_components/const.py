@@ -19,4 +19,4 @@ DEFAULT_LANGUAGE = "fr"
 DEFAULT_SCAN_INTERVAL = 5  # minutes
 MIN_SCAN_INTERVAL = 1  # minute
 MAX_SCAN_INTERVAL = 60  # minutes
-
+MIN_CACHE_AGE = 30  # seconds, below MIN_SCAN_INTERVAL
@@ -1,14 +1,12 @@
 """Sensor platform for Liberty Rider."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
-import aiohttp
-import async_timeout
-import re
-from urllib.parse import urlparse, parse_qs
 import json
 import os
+import time
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -19,9 +17,14 @@ from homeassistant.components.sensor import (
 from homeassistant.components.device_tracker import SourceType
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.const import (
     UnitOfLength,
@@ -32,8 +35,12 @@ from homeassistant.const import (
     CONF_SCAN_INTERVAL,
 )
 from homeassistant.helpers.translation import async_get_translations
+from homeassistant.util.json import json_loads
 
-from .const import DOMAIN, API_URL, CONF_SHARE_URL, BASE_URL, DEFAULT_SCAN_INTERVAL, CONF_LANGUAGE, DEFAULT_LANGUAGE
+from .const import (
+    DOMAIN, API_URL, CONF_SHARE_URL, BASE_URL, DEFAULT_SCAN_INTERVAL, CONF_LANGUAGE, DEFAULT_LANGUAGE,
+    MIN_CACHE_AGE
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -62,46 +69,151 @@ def get_translation(language: str, key: str) -> str:
         _LOGGER.error("Error loading translation for %s: %s", key, err)
         return key
 
-SENSOR_TYPES = {
-    "status": SensorEntityDescription(
+# Clés de traduction des états de trajet, indexées par état brut de l'API
+_STATE_TO_KEY: dict[str, str] = {}
+
+def _state_key(state: str) -> str:
+    """Return the translation key of a ride state."""
+    key = _STATE_TO_KEY.get(state)
+    if key is None:
+        key = _STATE_TO_KEY.setdefault(state, f"entity.sensor.status.state.{state.lower()}")
+    return key
+
+def _extract_location(data: dict | None) -> tuple[float | None, float | None]:
+    """Return the (latitude, longitude) of the rider from the ride data."""
+    if not data:
+        return None, None
+
+    try:
+        state = data.get("state")
+
+        # Si le trajet est actif, utiliser la position actuelle
+        if state == "RIDE_ACTIVE":
+            location = data.get("currentLocation")
+        # Sinon, obtenir la dernière position connue depuis les pauses
+        elif state in ("RIDE_PAUSED", "RIDE_STOPPED"):
+            pauses = data.get("pauses") or []
+            location = pauses[-1].get("lastLocation") if pauses else None
+        else:
+            location = None
+
+        if not location:
+            return None, None
+
+        latitude = location.get("latitude")
+        longitude = location.get("longitude")
+        return (
+            float(latitude) if latitude else None,
+            float(longitude) if longitude else None,
+        )
+
+    except (KeyError, TypeError, AttributeError, ValueError) as err:
+        _LOGGER.warning("Error getting location: %s", err)
+        return None, None
+
+def _build_attributes(data: dict | None) -> dict[str, any]:
+    """Return the extra state attributes of the tracker from the ride data."""
+    if not data:
+        return {}
+
+    try:
+        attributes = {}
+
+        # Ajouter des informations sur le trajet
+        if data.get("state"):
+            attributes["ride_status"] = _state_key(data["state"])
+
+        if data.get("distance"):
+            attributes["distance_km"] = round(data["distance"] / 1000, 2)
+
+        if data.get("duration"):
+            attributes["duration_minutes"] = round(data["duration"] / 60, 1)
+
+        battery_raw = data.get("currentBatteryLevel")
+        if battery_raw is not None:
+            try:
+                battery_pct = round(float(battery_raw) * 100, 1)
+            except (ValueError, TypeError):
+                battery_pct = None
+            if battery_pct is not None:
+                attributes["battery_level"] = battery_pct
+
+        return attributes
+
+    except Exception as err:
+        _LOGGER.warning("Error getting extra attributes: %s", err)
+        return {}
+
+def _value_extractor(field: str, convert):
+    """Return a state extractor applying convert to a field of the ride data."""
+    def extract(data: dict, language: str):
+        value = data.get(field)
+        if value is None:
+            return None
+        return convert(value)
+    return extract
+
+def _status_state(data: dict, language: str) -> str | None:
+    """Return the translated ride status."""
+    state = data.get("state")
+    if state is None:
+        return None
+    return get_translation(language, _state_key(state))
+
+# Extraction de l'état de chaque capteur, indexée par clé de description
+_STATE_EXTRACTORS = {
+    "status": _status_state,
+    "battery": _value_extractor("currentBatteryLevel", float),
+    # Convertir en kilomètres
+    "distance": _value_extractor("distance", lambda value: float(value) / 1000),
+    # Convertir en minutes
+    "duration": _value_extractor("duration", lambda value: int(value / 60)),
+    "pause_duration": _value_extractor("pauseDuration", lambda value: int(value / 60)),
+    "start_time": _value_extractor(
+        "startTime", lambda value: datetime.fromisoformat(value.replace("Z", "+00:00"))
+    ),
+}
+
+SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
         key="status",
         name="entity.sensor.status.name",
         icon="mdi:map-marker-path",
     ),
-    "battery": SensorEntityDescription(
+    SensorEntityDescription(
         key="battery",
         name="entity.sensor.battery.name",
         native_unit_of_measurement=PERCENTAGE,
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    "distance": SensorEntityDescription(
+    SensorEntityDescription(
         key="distance",
         name="entity.sensor.distance.name",
         native_unit_of_measurement=UnitOfLength.KILOMETERS,
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.TOTAL_INCREASING,
     ),
-    "duration": SensorEntityDescription(
+    SensorEntityDescription(
         key="duration",
         name="entity.sensor.duration.name",
         native_unit_of_measurement=UnitOfTime.MINUTES,
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.TOTAL_INCREASING,
     ),
-    "pause_duration": SensorEntityDescription(
+    SensorEntityDescription(
         key="pause_duration",
         name="entity.sensor.pause_duration.name",
         native_unit_of_measurement=UnitOfTime.MINUTES,
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.TOTAL_INCREASING,
     ),
-    "start_time": SensorEntityDescription(
+    SensorEntityDescription(
         key="start_time",
         name="entity.sensor.start_time.name",
         device_class=SensorDeviceClass.TIMESTAMP,
     ),
-}
+)
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -115,9 +227,16 @@ async def async_setup_entry(
     except Exception as err:
         raise ConfigEntryNotReady(f"Error initializing Liberty Rider coordinator: {err}")
 
-    entities = [LibertyRiderSensor(coordinator, description) for description in SENSOR_TYPES.values()]
-    entities.append(LibertyRiderGPSTracker(coordinator))
-    async_add_entities(entities)
+    # Obtenir le prénom de l'utilisateur
+    user_firstname = ((coordinator.data or {}).get("user") or {}).get("firstName", "")
+
+    entities = [
+        LibertyRiderSensor(coordinator, description, user_firstname)
+        for description in SENSOR_DESCRIPTIONS
+    ]
+    entities.append(LibertyRiderGPSTracker(coordinator, user_firstname))
+    # Les données sont déjà chargées par le premier rafraîchissement
+    async_add_entities(entities, update_before_add=False)
 
 class LibertyRiderCoordinator(DataUpdateCoordinator):
     """Liberty Rider coordinator."""
@@ -130,124 +249,139 @@ class LibertyRiderCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name="Liberty Rider",
             update_interval=timedelta(minutes=scan_interval),
+            # Ne notifier les entités que si les données du trajet ont changé
+            always_update=False,
         )
         self.share_url = config_entry.data[CONF_SHARE_URL]
         self.hass = hass
+        # Session partagée gérée par Home Assistant (ne pas la fermer)
+        self._session = async_get_clientsession(hass)
         _LOGGER.debug("Processing share URL: %s", self.share_url)
         
         # Nettoyer l'URL en retirant les paramètres de tracking et le @ si présent
         if self.share_url.startswith('@'):
             self.share_url = self.share_url[1:]
         
-        parsed_url = urlparse(self.share_url)
-        clean_path = parsed_url.path
-        
         # Extraire l'ID du trajet de l'URL (format: /fr/a/XXXXX)
-        match = re.search(r'/a/([^/]+)', clean_path)
-        if not match:
+        _, sep, rest = self.share_url.partition("/a/")
+        self.share_id = rest.split("/", 1)[0].split("?", 1)[0].split("#", 1)[0]
+        if not sep or not self.share_id:
             _LOGGER.error("Invalid share URL format: %s", self.share_url)
             raise ValueError("Invalid share URL format")
-        
-        self.share_id = match.group(1)
         _LOGGER.debug("Extracted share ID: %s", self.share_id)
 
+        # Corps et en-têtes de la requête GraphQL, identiques à chaque appel
+        self._request_json = {
+            "operationName": "rideSharingMapByUserCurrentRideSharingToken",
+            "variables": {"token": self.share_id},
+            "extensions": {
+                "persistedQuery": {
+                    "version": 1,
+                    "sha256Hash": "36aac840cff92e832aa03e04b58dd2a2357d3b7459c6416c991c8862acaf3476"
+                }
+            }
+        }
+        self._request_headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "x-apollo-operation-name": "rideSharingMapByUserCurrentRideSharingToken",
+            "apollo-require-preflight": "true",
+            "Origin": "https://rider.live",
+            "Referer": self.share_url
+        }
+
+        # Dernier résultat (horodatage monotone, trajet) et requête en cours
+        self._cache: tuple[float, dict] | None = None
+        self._inflight: asyncio.Task | None = None
+
     async def _async_update_data(self):
-        """Fetch data from API."""
+        """Fetch data from API, reusing a fresh or in-flight result.
+
+        Scheduled polls are always spaced beyond MIN_CACHE_AGE; only explicit
+        refreshes (update_entity, async_request_refresh) can get the cached ride.
+        """
+        if self._cache is not None and time.monotonic() - self._cache[0] < MIN_CACHE_AGE:
+            return self._cache[1]
+
+        # Partager la requête en cours plutôt que d'en lancer une seconde
+        if self._inflight is None:
+            self._inflight = self.hass.async_create_task(self._async_fetch_ride())
+            self._inflight.add_done_callback(self._fetch_done)
+
+        return await asyncio.shield(self._inflight)
+
+    @callback
+    def _fetch_done(self, task: asyncio.Task) -> None:
+        """Release the finished request and cache its result."""
+        # La requête peut survivre à l'annulation de l'appelant (shield) :
+        # c'est donc ici, et non chez l'appelant, qu'elle est libérée
+        self._inflight = None
+        if task.cancelled():
+            return
+        # Lire l'exception la marque comme récupérée, même sans appelant
+        if task.exception() is None:
+            self._cache = (time.monotonic(), task.result())
+
+    async def _async_fetch_ride(self) -> dict:
+        """Fetch the current ride from the API."""
         try:
-            async with async_timeout.timeout(10):
-                async with aiohttp.ClientSession() as session:
-                    data = {
-                        "operationName": "rideSharingMapByUserCurrentRideSharingToken",
-                        "variables": {"token": self.share_id},
-                        "extensions": {
-                            "persistedQuery": {
-                                "version": 1,
-                                "sha256Hash": "36aac840cff92e832aa03e04b58dd2a2357d3b7459c6416c991c8862acaf3476"
-                            }
-                        }
-                    }
+            async with asyncio.timeout(10):
+                _LOGGER.debug("Fetching ride details with share ID: %s", self.share_id)
+                
+                async with self._session.post(
+                    API_URL,
+                    json=self._request_json,
+                    headers=self._request_headers
+                ) as response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        _LOGGER.error("API Error %d: %s", response.status, error_text)
+                        raise UpdateFailed(f"Error {response.status}: {error_text}")
+                    
+                    data = await response.json(loads=json_loads)
+                    _LOGGER.debug("Received ride details response: %s", data)
                     
-                    headers = {
-                        "Content-Type": "application/json",
-                        "Accept": "application/json",
-                        "x-apollo-operation-name": "rideSharingMapByUserCurrentRideSharingToken",
-                        "apollo-require-preflight": "true",
-                        "Origin": "https://rider.live",
-                        "Referer": self.share_url
-                    }
+                    if "errors" in data:
+                        _LOGGER.error("GraphQL errors: %s", data["errors"])
+                        raise UpdateFailed(f"GraphQL error: {data['errors']}")
                     
-                    _LOGGER.debug("Fetching ride details with share ID: %s", self.share_id)
+                    if not data.get("data", {}).get("ride"):
+                        _LOGGER.error("No ride data found in response: %s", data)
+                        raise UpdateFailed("No ride data found")
+                    
+                    return data["data"]["ride"]
                     
-                    async with session.post(
-                        API_URL,
-                        json=data,
-                        headers=headers
-                    ) as response:
-                        if response.status != 200:
-                            error_text = await response.text()
-                            _LOGGER.error("API Error %d: %s", response.status, error_text)
-                            raise UpdateFailed(f"Error {response.status}: {error_text}")
-                        
-                        data = await response.json()
-                        _LOGGER.debug("Received ride details response: %s", data)
-                        
-                        if "errors" in data:
-                            _LOGGER.error("GraphQL errors: %s", data["errors"])
-                            raise UpdateFailed(f"GraphQL error: {data['errors']}")
-                        
-                        if not data.get("data", {}).get("ride"):
-                            _LOGGER.error("No ride data found in response: %s", data)
-                            raise UpdateFailed("No ride data found")
-                        
-                        return data["data"]["ride"]
-                        
         except Exception as err:
             _LOGGER.error("Error fetching Liberty Rider data: %s", err)
             raise UpdateFailed(f"Error communicating with Liberty Rider: {err}")
 
-class LibertyRiderSensor(SensorEntity):
+class LibertyRiderSensor(CoordinatorEntity[LibertyRiderCoordinator], SensorEntity):
     """Representation of a Liberty Rider sensor."""
 
     def __init__(
         self,
         coordinator: LibertyRiderCoordinator,
         description: SensorEntityDescription,
+        user_firstname: str,
     ) -> None:
         """Initialize the sensor."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self.entity_description = description
-        
-        # Obtenir le prénom de l'utilisateur
-        user_firstname = ""
-        if coordinator.data and coordinator.data.get("user"):
-            user = coordinator.data["user"]
-            user_firstname = user.get('firstName', '')
+        self._extractor = _STATE_EXTRACTORS[description.key]
         
         # Obtenir la langue configurée
-        language = coordinator.config_entry.data.get(CONF_LANGUAGE, DEFAULT_LANGUAGE)
+        self._language = coordinator.config_entry.data.get(CONF_LANGUAGE, DEFAULT_LANGUAGE)
         
         # Créer l'ID unique avec le prénom
         self._attr_unique_id = f"liberty_rider_{self.entity_description.key}_{user_firstname}"
         
         # Traduire le nom de l'entité
-        translated_name = get_translation(language, self.entity_description.name)
+        translated_name = get_translation(self._language, self.entity_description.name)
         self._attr_name = f"{translated_name} - {user_firstname}"
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.last_update_success
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        if not self.coordinator.data or not self.coordinator.data.get("user"):
-            return None
-            
-        user = self.coordinator.data["user"]
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.share_id)},
-            "name": f"Liberty Rider - {user.get('firstName', '')}",
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, coordinator.share_id)},
+            "name": f"Liberty Rider - {user_firstname}",
             "manufacturer": "Liberty Rider",
             "model": "Liberty Rider",
         }
@@ -259,102 +393,51 @@ class LibertyRiderSensor(SensorEntity):
             return None
 
         try:
-            data = self.coordinator.data
-            
-            if self.entity_description.key == "status":
-                state = data.get("state")
-                if state is None:
-                    return None
-                # Obtenir la langue configurée
-                language = self.coordinator.config_entry.data.get(CONF_LANGUAGE, DEFAULT_LANGUAGE)
-                # Traduire l'état
-                return get_translation(language, f"entity.sensor.status.state.{state.lower()}")
-                
-            elif self.entity_description.key == "battery":
-                battery_level = data.get("currentBatteryLevel")
-                if battery_level is None:
-                    return None
-                return float(battery_level)
-                
-            elif self.entity_description.key == "distance":
-                distance = data.get("distance")
-                if distance is None:
-                    return None
-                return float(distance) / 1000  # Convertir en kilomètres
-                
-            elif self.entity_description.key == "duration":
-                duration = data.get("duration")
-                if duration is None:
-                    return None
-                return int(duration / 60)  # Convertir en minutes
-                
-            elif self.entity_description.key == "pause_duration":
-                pause_duration = data.get("pauseDuration")
-                if pause_duration is None:
-                    return None
-                return int(pause_duration / 60)  # Convertir en minutes
-                
-            elif self.entity_description.key == "start_time":
-                start_time = data.get("startTime")
-                if start_time is None:
-                    return None
-                return datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-                
+            return self._extractor(self.coordinator.data, self._language)
         except Exception as err:
             _LOGGER.error("Error getting sensor state: %s", err)
             return None
 
-    async def async_update(self) -> None:
-        """Update the entity."""
-        await self.coordinator.async_request_refresh()
-
-class LibertyRiderGPSTracker(TrackerEntity):
+class LibertyRiderGPSTracker(CoordinatorEntity[LibertyRiderCoordinator], TrackerEntity):
     """Representation of a Liberty Rider GPS tracker."""
 
-    def __init__(self, coordinator: LibertyRiderCoordinator) -> None:
+    def __init__(self, coordinator: LibertyRiderCoordinator, user_firstname: str) -> None:
         """Initialize the GPS tracker."""
-        self.coordinator = coordinator
-        
-        # Obtenir le prénom de l'utilisateur
-        user_firstname = ""
-        if coordinator.data and coordinator.data.get("user"):
-            user = coordinator.data["user"]
-            user_firstname = user.get('firstName', '')
+        super().__init__(coordinator)
         
         # Obtenir la langue configurée
-        language = coordinator.config_entry.data.get(CONF_LANGUAGE, DEFAULT_LANGUAGE)
+        self._language = coordinator.config_entry.data.get(CONF_LANGUAGE, DEFAULT_LANGUAGE)
         
         # Créer l'ID unique avec le prénom
         self._attr_unique_id = f"liberty_rider_{user_firstname}_gps"
         
         # Traduire le nom de l'entité
-        translated_name = get_translation(language, "entity.sensor.status.name")
+        translated_name = get_translation(self._language, "entity.sensor.status.name")
         self._attr_name = f"{translated_name} - {user_firstname}"
         self._attr_icon = "mdi:map-marker"
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.last_update_success
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        if not self.coordinator.data or not self.coordinator.data.get("user"):
-            return None
-            
-        user = self.coordinator.data["user"]
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.share_id)},
-            "name": f"Liberty Rider - {user.get('firstName', '')}",
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, coordinator.share_id)},
+            "name": f"Liberty Rider - {user_firstname}",
             "manufacturer": "Liberty Rider",
             "model": "Liberty Rider",
         }
+        self._attr_source_type = SourceType.GPS
+        # Précision par défaut en mètres
+        self._attr_location_accuracy = 10
+        self._update_from_data()
 
-    @property
-    def source_type(self) -> SourceType:
-        """Return the source type of the device tracker."""
-        return SourceType.GPS
+    def _update_from_data(self) -> None:
+        """Refresh the cached location and attributes from the coordinator data."""
+        data = self.coordinator.data
+        self._attr_latitude, self._attr_longitude = _extract_location(data)
+        self._attr_extra_state_attributes = _build_attributes(data)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_data()
+        super()._handle_coordinator_update()
 
     @property
     def state(self) -> str:
@@ -364,117 +447,6 @@ class LibertyRiderGPSTracker(TrackerEntity):
             
         state = self.coordinator.data.get("state")
         if state:
-            # Obtenir la langue configurée
-            language = self.coordinator.config_entry.data.get(CONF_LANGUAGE, DEFAULT_LANGUAGE)
             # Traduire l'état
-            return get_translation(language, f"entity.sensor.status.state.{state.lower()}")
-        return STATE_NOT_HOME
-
-    @property
-    def latitude(self) -> float | None:
-        """Return latitude value of the device."""
-        if not self.coordinator.data:
-            return None
-            
-        try:
-            data = self.coordinator.data
-            state = data.get("state")
-            
-            # Si le trajet est actif, essayer d'obtenir la position actuelle
-            if state == "RIDE_ACTIVE":
-                # Vérifier s'il y a une position actuelle dans les données
-                current_location = data.get("currentLocation")
-                if current_location and current_location.get("latitude"):
-                    return float(current_location["latitude"])
-            
-            # Sinon, obtenir la dernière position connue depuis les pauses
-            if state in ["RIDE_PAUSED", "RIDE_STOPPED"]:
-                pauses = data.get("pauses", [])
-                if pauses:
-                    last_pause = pauses[-1]
-                    location = last_pause.get("lastLocation", {})
-                    if location and location.get("latitude"):
-                        return float(location["latitude"])
-            
-            return None
-            
-        except (KeyError, TypeError, AttributeError, ValueError) as err:
-            _LOGGER.warning("Error getting latitude: %s", err)
-            return None
-
-    @property
-    def longitude(self) -> float | None:
-        """Return longitude value of the device."""
-        if not self.coordinator.data:
-            return None
-            
-        try:
-            data = self.coordinator.data
-            state = data.get("state")
-            
-            # Si le trajet est actif, essayer d'obtenir la position actuelle
-            if state == "RIDE_ACTIVE":
-                # Vérifier s'il y a une position actuelle dans les données
-                current_location = data.get("currentLocation")
-                if current_location and current_location.get("longitude"):
-                    return float(current_location["longitude"])
-            
-            # Sinon, obtenir la dernière position connue depuis les pauses
-            if state in ["RIDE_PAUSED", "RIDE_STOPPED"]:
-                pauses = data.get("pauses", [])
-                if pauses:
-                    last_pause = pauses[-1]
-                    location = last_pause.get("lastLocation", {})
-                    if location and location.get("longitude"):
-                        return float(location["longitude"])
-            
-            return None
-            
-        except (KeyError, TypeError, AttributeError, ValueError) as err:
-            _LOGGER.warning("Error getting longitude: %s", err)
-            return None
-
-    @property
-    def location_accuracy(self) -> int:
-        """Return the location accuracy of the device."""
-        # Retourner une précision par défaut en mètres
-        return 10
-
-    @property
-    def extra_state_attributes(self) -> dict[str, any]:
-        """Return the extra state attributes."""
-        if not self.coordinator.data:
-            return {}
-            
-        try:
-            data = self.coordinator.data
-            attributes = {}
-            
-            # Ajouter des informations sur le trajet
-            if data.get("state"):
-                attributes["ride_status"] = f"entity.sensor.status.state.{data['state'].lower()}"
-            
-            if data.get("distance"):
-                attributes["distance_km"] = round(data["distance"] / 1000, 2)
-            
-            if data.get("duration"):
-                attributes["duration_minutes"] = round(data["duration"] / 60, 1)
-            
-            battery_raw = data.get("currentBatteryLevel")
-            if battery_raw is not None:
-                try:
-                    battery_pct = round(float(battery_raw) * 100, 1)
-                except (ValueError, TypeError):
-                    battery_pct = None
-                if battery_pct is not None:
-                    attributes["battery_level"] = battery_pct
-                
-            return attributes
-            
-        except Exception as err:
-            _LOGGER.warning("Error getting extra attributes: %s", err)
-            return {}
-
-    async def async_update(self) -> None:
-        """Update the entity."""
-        await self.coordinator.async_request_refresh()
\ No newline at end of file
+            return get_translation(self._language, _state_key(state))
+        return STATE_NOT_HOME
\ No newline at end of file